@@ -204,6 +204,11 @@ alembic==1.12.1
 redis==5.0.1
 hiredis==2.2.3
 
+# Shared Health Checks (shared/health_check.py)
+asyncpg==0.29.0
+aio-pika==9.3.1
+orjson==3.9.10
+
 # Event Processing
 aiokafka==0.10.0
 confluent-kafka==2.3.0
@@ -274,6 +279,11 @@ python-socketio==5.10.0
 pika==1.3.2  # RabbitMQ
 kombu==5.3.4
 
+# Shared Health Checks (shared/health_check.py)
+asyncpg==0.29.0
+aio-pika==9.3.1
+orjson==3.9.10
+
 # Security
 cryptography==41.0.7
 pyjwt==2.8.0
@@ -323,6 +333,10 @@ confluent-kafka==2.3.0
 psycopg2-binary==2.9.9
 sqlalchemy==2.0.23
 
+# Shared Health Checks (shared/health_check.py; orjson under Utilities)
+asyncpg==0.29.0
+aio-pika==9.3.1
+
 # Monitoring
 prometheus-client==0.19.0
 opentelemetry-api==1.21.0
@@ -366,6 +380,11 @@ psycopg2-binary==2.9.9
 # Redis
 redis==5.0.1
 
+# Shared Health Checks (shared/health_check.py)
+asyncpg==0.29.0
+aio-pika==9.3.1
+orjson==3.9.10
+
 # Authentication
 python-jose[cryptography]==3.3.0
 passlib[bcrypt]==1.7.4
@@ -413,6 +432,11 @@ influxdb-client==1.38.0
 # Redis
 redis==5.0.1
 
+# Shared Health Checks (shared/health_check.py)
+asyncpg==0.29.0
+aio-pika==9.3.1
+orjson==3.9.10
+
 # Monitoring & Metrics
 prometheus-client==0.19.0
 psutil==5.9.6
@@ -466,6 +490,11 @@ psycopg2-binary==2.9.9
 # Redis
 redis==5.0.1
 
+# Shared Health Checks (shared/health_check.py)
+asyncpg==0.29.0
+aio-pika==9.3.1
+orjson==3.9.10
+
 # Utilities
 python-dotenv==1.0.0
 structlog==23.2.0